@@ -1,11 +1,10 @@
-from typing import Union, Iterable, List, TYPE_CHECKING, Optional
+from typing import List, TYPE_CHECKING, Optional
 from mcdreforged.api.types import CommandSource
 from mcdreforged.api.command import *
 from mcdreforged.api.rtext import *
 
-import re
-
 from my_plugin.generic import MessageText
+from my_plugin.utils.misc import MiscTools
 
 
 if TYPE_CHECKING:
@@ -26,14 +25,12 @@ class CommandManager:
 
     def htr(self, translation_key: str, *args, _lb_htr_prefixes: Optional[List[str]] = None,
             **kwargs) -> RTextMCDRTranslation:
+        pattern = MiscTools.get_help_prefix_pattern(_lb_htr_prefixes or [])
+
         def __get_regex_result(line: str):
-            pattern = r'(?<=§7){}[\S ]*?(?=§)'
-            for prefix_tuple in _lb_htr_prefixes:
-                for prefix in prefix_tuple:
-                    result = re.search(pattern.format(prefix), line)
-                    if result is not None:
-                        return result
-            return None
+            if pattern is None:
+                return None
+            return pattern.search(line)
 
         def __htr(key: str, *inner_args, **inner_kwargs) -> MessageText:
             original, processed = self.plugin_inst.ntr(key, *inner_args, **inner_kwargs), []
@@ -52,7 +49,7 @@ class CommandManager:
         return RTextMCDRTranslation(translation_key, *args, **kwargs).set_translator(__htr)
 
     def show_help(self, source: CommandSource):
-        meta = self.server.get_self_metadata()
+        meta = self.plugin_inst.metadata
         source.reply(
             self.htr(
                 'help.detailed',
@@ -65,13 +62,14 @@ class CommandManager:
 
     def reload_self(self, source: CommandSource):
         # self.config.set_reloader(source)
-        self.server.reload_plugin(self.server.get_self_metadata().id)
+        self.server.reload_plugin(self.plugin_inst.metadata.id)
         source.reply(self.plugin_inst.rtr('loading.reloaded'))
 
     def register_command(self):
-        def permed_literal(literals: Union[str, Iterable[str]]) -> Literal:
-            literals = {literals} if isinstance(literals, str) else set(literals)
-            return Literal(literals).requires(self.config.get_permission_checker(*literals))
+        get_permission_checker = self.config.get_permission_checker
+
+        def permed_literal(*literals: str) -> Literal:
+            return Literal(set(literals)).requires(get_permission_checker(*literals))
 
         root_node: Literal = Literal(self.config.prefix).runs(lambda src: self.show_help(src))
 
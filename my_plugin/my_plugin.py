@@ -1,6 +1,7 @@
+import functools
 import os.path
 
-from mcdreforged.api.types import ServerInterface, PluginServerInterface, MCDReforgedLogger
+from mcdreforged.api.types import ServerInterface, PluginServerInterface, MCDReforgedLogger, Metadata
 from mcdreforged.api.rtext import RTextMCDRTranslation
 from typing import Optional, Self, IO
 
@@ -26,6 +27,8 @@ class MyPlugin:
     def __init__(self):
         self.server = ServerInterface.psi()
         # self.server = ServerInterface.psi_opt()  # psi_opt() if requires to be run standalone
+        # Metadata never changes during the lifetime of a loaded plugin instance
+        self.__metadata = self.server.get_self_metadata() if self.server is not None else None
         self.__verbosity = False
         # self.translator = BlossomTranslator(self)
         # self.translator.register_bundled_translations()
@@ -44,6 +47,10 @@ class MyPlugin:
     def logger(self) -> MCDReforgedLogger:
         return self.server.logger
 
+    @property
+    def metadata(self) -> Optional[Metadata]:
+        return self.__metadata
+
     @property
     def verbosity(self):
         return self.__verbosity
@@ -72,8 +79,9 @@ class MyPlugin:
             _lb_rtr_prefix: str = TRANSLATION_KEY_PREFIX,
             **kwargs
     ) -> RTextMCDRTranslation:
-        if not translation_key.startswith(_lb_rtr_prefix):
-            translation_key = f"{_lb_rtr_prefix}{translation_key}"
+        # Slice compare and plain concat are cheaper than startswith() and f-string for this hot path
+        if translation_key[:len(_lb_rtr_prefix)] != _lb_rtr_prefix:
+            translation_key = _lb_rtr_prefix + translation_key
         return RTextMCDRTranslation(translation_key, *args, **kwargs).set_translator(self.ntr)
 
     def ntr(
@@ -87,12 +95,20 @@ class MyPlugin:
             _lb_tr_log_error_message: bool = True,
             **kwargs
     ) -> MessageText:
+        fallback_language = _mcdr_tr_fallback_language or 'en_us'
         try:
+            if not args and not kwargs:
+                # Language is part of the cache key so switching MCDR language never serves stale text
+                return self.__static_tr(
+                    translation_key,
+                    _mcdr_tr_language or self.server.get_mcdr_language(),
+                    fallback_language
+                )
             return self.server.tr(
                 translation_key,
                 *args,
                 _mcdr_tr_language=_mcdr_tr_language,
-                _mcdr_tr_fallback_language=_mcdr_tr_fallback_language or 'en_us',
+                _mcdr_tr_fallback_language=fallback_language,
                 _mcdr_tr_allow_failure=False,
                 **kwargs
             )
@@ -111,6 +127,16 @@ class MyPlugin:
             else:
                 raise KeyError(f'Translation key "{translation_key}" not found with language {languages}')
 
+    @functools.lru_cache(maxsize=512)
+    def __static_tr(self, translation_key: str, language: str, fallback_language: str) -> str:
+        # Failures raise and are therefore never cached
+        return self.server.tr(
+            translation_key,
+            _mcdr_tr_language=language,
+            _mcdr_tr_fallback_language=fallback_language,
+            _mcdr_tr_allow_failure=False
+        )
+
     def ktr(
             self,
             translation_key: str,
@@ -1,7 +1,9 @@
 import enum
+import io
 import os
 import contextlib
 import shutil
+import stat
 
 from zipfile import ZipFile
 from typing import ContextManager, TextIO, Optional, List
@@ -19,10 +21,15 @@ class FileUtils(AbstractUtil):
 
     @staticmethod
     def delete(target_file_path: str):
-        if os.path.isfile(target_file_path):
-            os.remove(target_file_path)
-        elif os.path.isdir(target_file_path):
+        # One lstat() instead of separate isfile() and isdir() checks
+        try:
+            file_stat = os.lstat(target_file_path)
+        except FileNotFoundError:
+            return
+        if stat.S_ISDIR(file_stat.st_mode):
             shutil.rmtree(target_file_path)
+        else:
+            os.remove(target_file_path)
 
 
     @classmethod
@@ -36,13 +43,13 @@ class FileUtils(AbstractUtil):
 
     @classmethod
     def lf_read(cls, target_file_path: str, *, is_bundled: bool = False, encoding: str = 'utf8') -> str:
+        # newline=None lets the decoder translate CRLF and CR to LF while reading
         if is_bundled:
             with cls._plugin_inst.server.open_bundled_file(target_file_path) as f:
-                file_string = f.read()
-        else:
-            with open(target_file_path, 'r', encoding=encoding) as f:
-                file_string = f.read()
-        return file_string.replace(cls.LineBreak.CRLF.value, cls.LineBreak.LF.value).replace(cls.LineBreak.CR.value, cls.LineBreak.LF.value)
+                with io.TextIOWrapper(f, encoding=encoding, newline=None) as text_file:
+                    return text_file.read()
+        with open(target_file_path, 'r', encoding=encoding, newline=None) as f:
+            return f.read()
 
 
     @staticmethod
@@ -57,7 +64,7 @@ class FileUtils(AbstractUtil):
         server = cls._plugin_inst.server
         package = PACKAGE_PATH
         if server is not None:
-            return server.get_plugin_file_path(server.get_self_metadata().id)
+            return server.get_plugin_file_path(cls._plugin_inst.metadata.id)
         if os.path.isdir(package):
             return os.listdir(os.path.join(package, directory_name))
         with ZipFile(package, 'r') as zip_file:
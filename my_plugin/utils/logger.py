@@ -12,6 +12,9 @@ if TYPE_CHECKING:
     from my_plugin.my_plugin import MyPlugin
 
 
+_ANSI_COLOR_RE: re.Pattern = re.compile(r'\033\[(?:\d+(?:;\d+)?)?m')
+
+
 class BlossomLogger(MCDReforgedLogger):
     class NoColorFormatter(logging.Formatter):
         def formatMessage(self, record) -> str:
@@ -19,7 +22,10 @@ class BlossomLogger(MCDReforgedLogger):
 
         @staticmethod
         def clean_console_color_code(text: str) -> str:
-            return re.compile(r'\033\[(\d+(;\d+)?)?m').sub('', text)
+            # Most lines carry no escape sequence, a substring check is much cheaper than running the regex
+            if '\033' not in text:
+                return text
+            return _ANSI_COLOR_RE.sub('', text)
 
         @staticmethod
         def clean_minecraft_color_code(text: str):
@@ -36,7 +42,7 @@ class BlossomLogger(MCDReforgedLogger):
         psi = self.__inst.server
         self._blossom_file_handler = None
         if psi is not None:
-            super().__init__(psi.get_self_metadata().id)
+            super().__init__(self.__inst.metadata.id)
         else:
             super().__init__()
 
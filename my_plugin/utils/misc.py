@@ -1,10 +1,11 @@
 import functools
 import inspect
+import re
 import sys
 import threading
 from ruamel import yaml
 from io import StringIO
-from typing import Optional, Callable, Union, TYPE_CHECKING
+from typing import Optional, Callable, Union, Iterable, TYPE_CHECKING
 
 from mcdreforged.api.decorator import FunctionThread
 from mcdreforged.api.types import PluginServerInterface, ServerInterface
@@ -18,7 +19,7 @@ if TYPE_CHECKING:
 class MiscTools(AbstractUtil):
     @classmethod
     def get_thread_prefix(cls) -> str:
-        return cls.to_camel_case(cls._plugin_inst.server.get_self_metadata().name, divider='_') + '_'
+        return cls.to_camel_case(cls._plugin_inst.metadata.name, divider='_') + '_'
 
     @classmethod
     def named_thread(cls, arg: Optional[Union[str, Callable]] = None) -> Callable:
@@ -76,3 +77,15 @@ class MiscTools(AbstractUtil):
             yaml_inst.dump(data, stream)
             stream.seek(0)
             return stream.read()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def __compile_help_prefix_pattern(prefixes: tuple) -> Optional[re.Pattern]:
+        if len(prefixes) == 0:
+            return None
+        return re.compile(r'(?<=§7)(?:{})[\S ]*?(?=§)'.format('|'.join(map(re.escape, prefixes))))
+
+    @classmethod
+    def get_help_prefix_pattern(cls, prefixes: Union[str, Iterable[str]]) -> Optional[re.Pattern]:
+        prefixes = (prefixes,) if isinstance(prefixes, str) else tuple(prefixes)
+        return cls.__compile_help_prefix_pattern(prefixes)
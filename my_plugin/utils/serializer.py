@@ -1,6 +1,8 @@
+import copy
 import os
 import shutil
-from typing import List, Optional, Tuple, get_origin, Type, TYPE_CHECKING
+import stat
+from typing import Any, Dict, List, Optional, Tuple, Union, get_origin, TYPE_CHECKING
 
 from mcdreforged.api.types import CommandSource
 from mcdreforged.api.utils import Serializable, deserialize
@@ -8,46 +10,83 @@ from ruamel import yaml
 
 from my_plugin.constants import TRANSLATION_KEY_PREFIX
 from my_plugin.utils.file_util import FileUtils
+from my_plugin.utils.misc import MiscTools
 
 if TYPE_CHECKING:
     from my_plugin.my_plugin import MyPlugin
 
 
 class BlossomSerializable(Serializable):
+    _annotations_cache: Optional[Dict[str, Any]] = None
+    _default_serialized_cache: Optional[dict] = None
+    _field_plan_cache: Optional[Tuple[Tuple[str, Any, bool], ...]] = None
+
+    @classmethod
+    def _cached_annotations(cls) -> Dict[str, Any]:
+        # Look up in cls.__dict__ so subclasses never pick up their parent's cache
+        cached = cls.__dict__.get('_annotations_cache')
+        if cached is None:
+            cached = cls._annotations_cache = cls.get_field_annotations()
+        return cached
+
+    @classmethod
+    def _cached_default_serialized(cls) -> dict:
+        # Shared between calls, copy values before handing them out
+        cached = cls.__dict__.get('_default_serialized_cache')
+        if cached is None:
+            cached = cls._default_serialized_cache = cls.get_default().serialize()
+        return cached
+
+    @classmethod
+    def _cached_field_plan(cls) -> Tuple[Tuple[str, Any, bool], ...]:
+        # (key, target_type, is_nested_blossom) per field, so type introspection happens once per class
+        cached = cls.__dict__.get('_field_plan_cache')
+        if cached is None:
+            cached = cls._field_plan_cache = tuple(
+                (key, target_type, get_origin(target_type) is None and issubclass(target_type, BlossomSerializable))
+                for key, target_type in cls._cached_annotations().items()
+            )
+        return cached
+
+    @classmethod
+    def invalidate_cache(cls):
+        cls._annotations_cache = None
+        cls._default_serialized_cache = None
+        cls._field_plan_cache = None
+
     @classmethod
-    def _fix_data(cls, data: dict, *, father_nodes: Optional[List[str]] = None) -> Tuple[dict, List[str]]:
-        needs_save = list()
-        annotations = cls.get_field_annotations()
-        default_data = cls.get_default().serialize()
-        if father_nodes is None:
-            father_nodes = []
+    def _fix_data(
+            cls,
+            data: dict,
+            *,
+            father_prefix: str = '',
+            needs_save: Optional[List[str]] = None
+    ) -> Union[dict, Tuple[dict, List[str]]]:
+        # Outermost call owns the accumulator and returns it, nested calls only extend it in place
+        is_root = needs_save is None
+        if is_root:
+            needs_save = []
+        field_plan = cls._cached_field_plan()
+        default_data = cls._cached_default_serialized()
         fixed_dict = {}
 
-        for key, target_type in annotations.items():
-            current_nodes = father_nodes.copy()
-            current_nodes.append(key)
-            node_name = '.'.join(current_nodes)
-            if key not in data.keys():
-                if key in default_data.keys():
+        for key, target_type, is_nested_blossom in field_plan:
+            node_name = f'{father_prefix}.{key}' if father_prefix else key
+            if key not in data:
+                if key in default_data:
                     needs_save.append(node_name)
-                    fixed_dict[key] = default_data[key]
+                    fixed_dict[key] = copy.deepcopy(default_data[key])
                 continue
             value = data[key]
 
-            def fix_blossom(single_type: Type[BlossomSerializable], single_data: dict):
-                nonlocal needs_save
-                single_data, save_nodes = single_type._fix_data(single_data, father_nodes=current_nodes)
-                needs_save += save_nodes
-                return single_data
-
-            if get_origin(target_type) is None and issubclass(target_type, BlossomSerializable):
-                value = fix_blossom(target_type, value)
+            if is_nested_blossom:
+                value = target_type._fix_data(value, father_prefix=node_name, needs_save=needs_save)
             else:
                 try:
                     value = deserialize(value, target_type, error_at_redundancy=True)
                 except (ValueError, TypeError):
                     needs_save.append(node_name)
-                    if key not in default_data.keys():
+                    if key not in default_data:
                         continue
                     if isinstance(target_type, Serializable):
                         value = target_type.get_default().serialize()
@@ -55,17 +94,36 @@ class BlossomSerializable(Serializable):
                         try:
                             value = target_type(value)
                         except:
-                            value = default_data[key]
+                            value = copy.deepcopy(default_data[key])
             fixed_dict[key] = value
-        return fixed_dict, needs_save
+        if is_root:
+            return fixed_dict, needs_save
+        return fixed_dict
 
 
 class ConfigurationBase(BlossomSerializable):
-    __rt_yaml = yaml.YAML(typ='rt')
-    __safe_yaml = yaml.YAML(typ='safe')
-    for item in (__rt_yaml, __safe_yaml):  # type: yaml.YAML
-        item.width = 1048576
-        item.indent(2, 2, 2)
+    # Created on first use, keeps ruamel's dumper setup out of plugin loading
+    _rt_yaml: Optional[yaml.YAML] = None
+    _safe_yaml: Optional[yaml.YAML] = None
+
+    @staticmethod
+    def __new_yaml(typ: str) -> yaml.YAML:
+        yaml_inst = yaml.YAML(typ=typ)
+        yaml_inst.width = 1048576
+        yaml_inst.indent(2, 2, 2)
+        return yaml_inst
+
+    @classmethod
+    def _get_rt_yaml(cls) -> yaml.YAML:
+        if ConfigurationBase._rt_yaml is None:
+            ConfigurationBase._rt_yaml = cls.__new_yaml('rt')
+        return ConfigurationBase._rt_yaml
+
+    @classmethod
+    def _get_safe_yaml(cls) -> yaml.YAML:
+        if ConfigurationBase._safe_yaml is None:
+            ConfigurationBase._safe_yaml = cls.__new_yaml('safe')
+        return ConfigurationBase._safe_yaml
 
     def __init__(self, **kwargs):
         self.__file_path = None
@@ -90,7 +148,7 @@ class ConfigurationBase(BlossomSerializable):
     def get_template(self) -> yaml.CommentedMap:
         try:
             with self.__plugin_inst.server.open_bundled_file(self.__bundled_template_path) as f:
-                return self.__rt_yaml.load(f)
+                return self._get_rt_yaml().load(f)
         except Exception as e:
             self.logger.warning("Template not found, is plugin modified?", exc_info=e)
             return yaml.CommentedMap()
@@ -130,7 +188,7 @@ class ConfigurationBase(BlossomSerializable):
         # Load & Fix data
         try:
             string = FileUtils.lf_read(file_path, encoding=encoding)
-            read_data: dict = cls.__safe_yaml.load(string)
+            read_data: dict = cls._get_safe_yaml().load(string)
         except:
             # Reading failed, remove current file
             FileUtils.delete(file_path)
@@ -178,34 +236,40 @@ class ConfigurationBase(BlossomSerializable):
         file_path = self.__file_path
         config_temp_path = os.path.join(os.path.dirname(file_path), f"temp_{os.path.basename(file_path)}")
 
-        if os.path.isdir(file_path):
+        try:
+            file_mode = os.stat(file_path).st_mode
+        except FileNotFoundError:
+            file_mode = None
+        if file_mode is not None and stat.S_ISDIR(file_mode):
             shutil.rmtree(file_path)
+        config_file_exists = file_mode is not None and stat.S_ISREG(file_mode)
 
         def _save(safe_dump: bool = False):
-            if os.path.exists(config_temp_path):
-                FileUtils.delete(config_temp_path)
+            # Left over by older versions which validated through a temp file
+            FileUtils.delete(config_temp_path)
 
             config_content = self.serialize()
             if safe_dump:
                 with FileUtils.safe_write(file_path, encoding=encoding) as f:
-                    self.__safe_yaml.dump(config_content, f)
+                    self._get_safe_yaml().dump(config_content, f)
                 self.logger.warning("Validation during config file saving failed, saved without original format")
             else:
                 formatted_config: yaml.CommentedMap
-                if os.path.isfile(file_path):
-                    formatted_config = self.__rt_yaml.load(FileUtils.lf_read(file_path, encoding=encoding))
+                if config_file_exists:
+                    formatted_config = self._get_rt_yaml().load(FileUtils.lf_read(file_path, encoding=encoding))
                 else:
                     formatted_config = self.get_template()
                 for key, value in config_content.items():
                     formatted_config[key] = value
-                with FileUtils.safe_write(config_temp_path, encoding=encoding) as f:
-                    self.__rt_yaml.dump(formatted_config, f)
+                # Validate the dumped text in memory, no need to read it back from disk
+                config_string = MiscTools.yaml_dump_to_string(formatted_config, yaml_inst=self._get_rt_yaml())
                 try:
-                    self.deserialize(self.__safe_yaml.load(FileUtils.lf_read(config_temp_path, encoding=encoding)))
-                except (TypeError, ValueError):
+                    self.deserialize(self._get_safe_yaml().load(config_string))
+                except (TypeError, ValueError, yaml.YAMLError):
                     log("Attempting saving config with original file format due to validation failure while attempting saving config and keep local config file format")
                     log("There may be mistakes in original config file format, please contact plugin maintainer")
                     _save(safe_dump=True)
                 else:
-                    os.replace(config_temp_path, file_path)
+                    with FileUtils.safe_write(file_path, encoding=encoding) as f:
+                        f.write(config_string)
         _save()
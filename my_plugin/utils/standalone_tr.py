@@ -1,7 +1,7 @@
 import contextlib
 import json
 import os
-import re
+from itertools import chain
 from threading import RLock
 from typing import Optional, List, Dict, Union, TYPE_CHECKING
 
@@ -12,6 +12,7 @@ from ruamel.yaml import YAML
 from my_plugin.constants import PLUGIN_ID
 from my_plugin.generic import MessageText
 from my_plugin.utils.file_util import FileUtils
+from my_plugin.utils.misc import MiscTools
 
 if TYPE_CHECKING:
     from my_plugin.my_plugin import MyPlugin
@@ -149,7 +150,7 @@ class BlossomTranslator:
         if translated_formatter is _NONE:
             raise KeyError("Translation key does not exist")
 
-        use_rtext = any([isinstance(e, RTextBase) for e in list(args) + list(kwargs.values())])
+        use_rtext = any(isinstance(e, RTextBase) for e in chain(args, kwargs.values()))
         try:
             if use_rtext:
                 return RTextBase.format(translated_formatter, *args, **kwargs)
@@ -184,14 +185,12 @@ class BlossomTranslator:
                     raise e
 
     def htr(self, translation_key: str, *args, _prefixes: Optional[List[str]] = None, **kwargs) -> RTextMCDRTranslation:
+        pattern = MiscTools.get_help_prefix_pattern(_prefixes or [])
+
         def __get_regex_result(line: str):
-            pattern = r'(?<=§7){}[\S ]*?(?=§)'
-            for prefix_tuple in _prefixes:
-                for prefix in prefix_tuple:
-                    result = re.search(pattern.format(prefix), line)
-                    if result is not None:
-                        return result
-            return None
+            if pattern is None:
+                return None
+            return pattern.search(line)
 
         def __htr(key: str, *inner_args, **inner_kwargs) -> MessageText:
             original, processed = self.ntr(key, *inner_args, **inner_kwargs), []
@@ -216,8 +215,8 @@ class BlossomTranslator:
 
     def rtr(self, translation_key: str, *args, _with_prefix: bool = True, **kwargs) -> RTextMCDRTranslation:
         prefix = self.get_translation_key_prefix()
-        if _with_prefix and not translation_key.startswith(prefix):
-            translation_key = f"{prefix}{translation_key}"
+        if _with_prefix and translation_key[:len(prefix)] != prefix:
+            translation_key = prefix + translation_key
         return RTextMCDRTranslation(translation_key, *args, **kwargs).set_translator(self.ntr)
 
     def ktr(